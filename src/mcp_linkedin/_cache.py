@@ -0,0 +1,75 @@
+"""
+Cache-aside storage for LinkedIn API responses.
+
+Entries live in Redis when ``REDIS_URL`` is set, so they are shared between
+server processes and survive restarts. Otherwise an in-process TTL cache is
+used.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Optional
+
+from cachetools import TLRUCache
+
+logger = logging.getLogger(__name__)
+
+class _MemoryBackend:
+    def __init__(self, maxsize: int):
+        # Each entry is stored as (value, ttl) so items can expire independently
+        self._cache = TLRUCache(maxsize=maxsize, ttu=lambda _key, item, now: now + item[1])
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._cache.get(key)
+        return None if item is None else item[0]
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        with self._lock:
+            self._cache[key] = (value, ttl)
+
+class _RedisBackend:
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url)
+        self._errors = redis.RedisError
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = self._client.get(key)
+        except self._errors as e:
+            # Treat an unavailable cache as a miss rather than failing the tool
+            logger.warning(f"Error reading {key} from Redis: {e}")
+            return None
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            self._client.set(key, json.dumps(value), ex=ttl)
+        except self._errors as e:
+            logger.warning(f"Error writing {key} to Redis: {e}")
+
+_backend = _RedisBackend(os.environ["REDIS_URL"]) if os.getenv("REDIS_URL") else _MemoryBackend(maxsize=10000)
+
+def get(key: str) -> Optional[Any]:
+    """
+    Return the cached value for ``key``.
+
+    :return: The cached value, or None on a miss or expiry
+    """
+    return _backend.get(key)
+
+def put(key: str, value: Any, ttl: int) -> None:
+    """
+    Store ``value`` under ``key`` for ``ttl`` seconds.
+
+    :param value: JSON-serializable value
+    """
+    _backend.set(key, value, ttl)
+
+def make_key(kind: str, **params: Any) -> str:
+    """Build a stable cache key from a request kind and its parameters."""
+    return f"{kind}:{json.dumps(params, sort_keys=True, separators=(',', ':'))}"
@@ -1,17 +1,453 @@
 from linkedin_api import Linkedin
+from linkedin_api.client import ChallengeException, UnauthorizedException
+from linkedin_api.cookie_repository import CookieRepository, LinkedinSessionExpired
+from mcp_linkedin import _cache
 from fastmcp import FastMCP
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError, Timeout
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 import os
+import asyncio
 import logging
+import re
+import threading
+import time
 import json
-from typing import List, Optional, Dict, Any, Union
+import ahocorasick
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from itertools import accumulate
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library serializer
+    orjson = None
 
 mcp = FastMCP("mcp-linkedin")
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent LinkedIn requests issued by a single tool call
+MAX_WORKERS = 8
+
+# Pooled connections kept per host; sized for several tools fanning out at once
+HTTP_POOL_SIZE = 32
+
+# Employee count bounds for the company_size filter of generate_lead_recommendations
+COMPANY_SIZE_RANGES = {
+    "small": (1, 50),
+    "medium": (51, 500),
+    "large": (501, float('inf'))
+}
+
+# Public URL prefixes for profiles and company pages
+_PROFILE_URL_PREFIX = "https://www.linkedin.com/in/"
+_COMPANY_URL_PREFIX = "https://www.linkedin.com/company/"
+
+# Title fragments marking a decision maker in analyze_prospect_profile
+_DM_TITLE_RE = re.compile(r"cto|cio|vp|director|chief|head|lead|senior|manager", re.IGNORECASE)
+
+# Network failures worth retrying; anything else is reported straight away
+TRANSIENT_ERRORS = (ConnectionError, RequestsConnectionError, HTTPError, Timeout)
+
+# LinkedIn client methods wrapped with retries and the circuit breaker
+RESILIENT_METHODS = (
+    "search_people", "search_companies", "search_jobs", "get_company",
+    "get_company_updates", "get_profile", "get_profile_skills", "get_job",
+)
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling LinkedIn while the circuit breaker is open."""
+
+class _CircuitBreaker:
+    """
+    Count consecutive transient failures and reject calls for a while once
+    ``fail_max`` is reached.
+
+    The lock only guards the counters; it is never held while a LinkedIn call
+    (or its retry backoff) is in flight, so concurrent calls don't serialize.
+    """
+
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError("LinkedIn is failing repeatedly; not retrying for now")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            # Past the reset timeout a single further failure reopens the circuit
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+# Stop calling LinkedIn for a minute after repeated network failures, so an
+# outage fails fast instead of tying up worker threads in retries
+_breaker = _CircuitBreaker(fail_max=5, reset_timeout=60)
+
+def _resilient(method):
+    """Wrap a LinkedIn client method with exponential-backoff retries and the circuit breaker."""
+    retrying = retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=2, max=30),
+        retry=retry_if_exception_type(TRANSIENT_ERRORS),
+        reraise=True,
+    )(method)
+
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        _breaker.before_call()
+        try:
+            result = retrying(*args, **kwargs)
+        except TRANSIENT_ERRORS:
+            _breaker.record_failure()
+            raise
+        _breaker.record_success()
+        return result
+    return wrapper
+
+def _raise_for_transient_status(response, *args, **kwargs):
+    """
+    Session response hook turning rate limits and server errors into HTTPError.
+
+    linkedin_api never checks status codes itself, so without this a 429 or
+    5xx would be parsed as an empty result instead of being retried.
+    """
+    if response.status_code == 429 or response.status_code >= 500:
+        response.raise_for_status()
+
+LINKEDIN_EMAIL = os.getenv("LINKEDIN_EMAIL")
+LINKEDIN_PASSWORD = os.getenv("LINKEDIN_PASSWORD")
+
+def _require_credentials():
+    if not (LINKEDIN_EMAIL and LINKEDIN_PASSWORD):
+        raise RuntimeError("LINKEDIN_EMAIL and LINKEDIN_PASSWORD environment variables must be set")
+
+# Report missing credentials at startup instead of on the first tool call.
+# MCP_LINKEDIN_LAZY=1 defers the check until a client is first needed.
+if os.getenv("MCP_LINKEDIN_LAZY") != "1":
+    _require_credentials()
+
+# Session cookies are cached on disk (one file per account) so restarts can
+# skip the username/password login flow.
+COOKIES_DIR = os.getenv(
+    "LINKEDIN_COOKIES_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "mcp-linkedin", "cookies"),
+)
+
+_client_lock = threading.Lock()
+
+# Set when LinkedIn rejects the password login. Later calls fail with it
+# instead of logging in again, since repeated failed logins can lock the account.
+_login_error: Optional[Exception] = None
+
 def get_client():
-    return Linkedin(os.getenv("LINKEDIN_EMAIL"), os.getenv("LINKEDIN_PASSWORD"), debug=True)
+    """
+    Return the shared LinkedIn client.
+
+    The client is created on first use and reused by every tool, so the login
+    handshake happens once per process and the underlying HTTP session (and its
+    connection pool) is shared across calls. Cookies from a previous login are
+    reused when LinkedIn still accepts them; otherwise a fresh login is performed.
+    If LinkedIn rejects that login, every later call fails until restart.
+    """
+    # Tools run on worker threads, so guard against concurrent first logins
+    with _client_lock:
+        if _login_error is not None:
+            raise RuntimeError(f"LinkedIn login failed, restart the server to retry: {_login_error!r}") from _login_error
+        return _create_client()
+
+@lru_cache(maxsize=1)
+def _create_client():
+    _require_credentials()
+    # linkedin_api appends the account name directly to the directory path
+    cookies_dir = os.path.join(COOKIES_DIR, "")
+
+    client = _client_from_cached_cookies(cookies_dir)
+    if client is None:
+        try:
+            client = Linkedin(LINKEDIN_EMAIL, LINKEDIN_PASSWORD, debug=False, refresh_cookies=True, cookies_dir=cookies_dir)
+        except (ChallengeException, UnauthorizedException) as e:
+            global _login_error
+            _login_error = e
+            raise
+
+    # requests keeps only 10 connections per host by default, which would make
+    # concurrent fan-outs queue for a free connection. Retries are left to
+    # _resilient so attempts don't multiply across layers.
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    client.client.session.mount("https://", adapter)
+    client.client.session.mount("http://", adapter)
+    client.client.session.hooks["response"].append(_raise_for_transient_status)
+
+    for name in RESILIENT_METHODS:
+        setattr(client, name, _resilient(getattr(client, name)))
+
+    return client
+
+def _client_from_cached_cookies(cookies_dir: str) -> Optional[Linkedin]:
+    """
+    Build a client from cookies saved by an earlier login.
+
+    linkedin_api only checks the JSESSIONID expiry of cached cookies, so the
+    session is confirmed with one authenticated request before it is reused.
+
+    :return: The client, or None if there are no usable cookies
+    """
+    try:
+        cookies = CookieRepository(cookies_dir=cookies_dir).get(LINKEDIN_EMAIL)
+    except LinkedinSessionExpired:
+        logger.info("Cached LinkedIn session expired, logging in again")
+        return None
+    if not cookies:
+        return None
+
+    client = Linkedin(LINKEDIN_EMAIL, LINKEDIN_PASSWORD, debug=False, cookies=cookies, cookies_dir=cookies_dir)
+    response = client._fetch("/me")
+    if response.status_code in (401, 403):
+        logger.warning(f"Cached LinkedIn session rejected ({response.status_code}), logging in again")
+        return None
+    return client
+
+def _offload(func):
+    """
+    Run a blocking tool in a worker thread.
+
+    linkedin_api is synchronous, so without this every tool call would block
+    the server's event loop until all of its LinkedIn requests finished.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+# Entity lookups and company searches are cached (see _cache) so repeated
+# requests within the TTL skip LinkedIn entirely
+COMPANY_CACHE_TTL = 3600
+PROFILE_CACHE_TTL = 300
+SEARCH_CACHE_TTL = 120
+JOB_CACHE_TTL = 3600
+
+def _cached(key: str, ttl: int, fetch, refresh: bool = False):
+    """
+    Return the cached value for ``key``, calling ``fetch`` on a miss.
+
+    :param refresh: Bypass the cache and store a freshly fetched value
+    """
+    if not refresh:
+        value = _cache.get(key)
+        if value is not None:
+            return value
+
+    value = fetch()
+    # linkedin_api returns an empty result when a request fails, which must
+    # not be served from the cache as if it were real data
+    if value:
+        _cache.put(key, value, ttl)
+    return value
+
+def cached_get_company(company_id: str, refresh: bool = False) -> Dict[str, Any]:
+    return _cached(f"company:{company_id}", COMPANY_CACHE_TTL, lambda: get_client().get_company(company_id), refresh)
+
+def cached_get_profile(profile_id: str, refresh: bool = False) -> Dict[str, Any]:
+    return _cached(f"profile:{profile_id}", PROFILE_CACHE_TTL, lambda: get_client().get_profile(profile_id), refresh)
+
+def cached_get_profile_skills(profile_id: str, refresh: bool = False) -> List[Dict[str, Any]]:
+    return _cached(f"skills:{profile_id}", PROFILE_CACHE_TTL, lambda: get_client().get_profile_skills(profile_id), refresh)
+
+def cached_get_job(job_id: str, refresh: bool = False) -> Dict[str, Any]:
+    return _cached(f"job:{job_id}", JOB_CACHE_TTL, lambda: get_client().get_job(job_id=job_id), refresh)
+
+def cached_search_companies(keywords: List[str], limit: int, refresh: bool = False) -> List[Dict[str, Any]]:
+    key = _cache.make_key("search_companies", keywords=keywords, limit=limit)
+    return _cached(key, SEARCH_CACHE_TTL, lambda: get_client().search_companies(keywords=keywords, limit=limit), refresh)
+
+@lru_cache(maxsize=128)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """
+    Build an Aho-Corasick automaton over the lowercased ``keywords``.
+
+    Unlike a regex alternation it reports overlapping keywords, so scanning a
+    text once gives the same hits as testing each keyword with ``in``.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        keyword_lower = keyword.lower()
+        if keyword_lower:
+            automaton.add_word(keyword_lower, keyword_lower)
+    automaton.make_automaton()
+    return automaton
+
+def _scan_keywords(automaton, text: str) -> set:
+    """Return the lowercased keywords occurring in the lowercased ``text``."""
+    if not text or not len(automaton):
+        return set()
+    return {keyword for _, keyword in automaton.iter(text)}
+
+# Service keywords analyze_prospect_profile looks for when none are given.
+# Kept in order because mentions are reported in keyword order.
+_DEFAULT_SERVICE_KEYWORDS = (
+    "cloud", "migration", "digital transformation", "infrastructure", "security",
+    "automation", "devops", "ai", "machine learning", "data analytics", "integration",
+    "erp", "crm", "software development", "consulting", "it services"
+)
+_DEFAULT_SERVICE_KEYWORDS_LC = tuple((keyword, keyword.lower()) for keyword in _DEFAULT_SERVICE_KEYWORDS)
+_DEFAULT_SERVICE_AUTOMATON = _keyword_automaton(_DEFAULT_SERVICE_KEYWORDS)
+
+def _first_mentions(automaton, texts: List[str]) -> Dict[str, int]:
+    """
+    Scan ``texts`` in a single pass over one newline-joined buffer.
+
+    :return: Each lowercased keyword found, mapped to the index of the first text containing it
+    """
+    texts_lower = [text.lower() for text in texts]
+    buffer = "\n".join(texts_lower)
+    if not buffer or not len(automaton):
+        return {}
+
+    # Offset just past each text's trailing newline, for mapping hits back to texts
+    bounds = list(accumulate(len(text) + 1 for text in texts_lower))
+    first = {}
+    # Hits arrive in buffer order, so the first hit of a keyword is in its earliest text
+    for end, keyword in automaton.iter(buffer):
+        if keyword not in first:
+            first[keyword] = bisect_right(bounds, end - len(keyword) + 1)
+    return first
+
+def _search_people_by_titles(client: Linkedin, company_name: str, titles: List[str], limit: int) -> List[Dict[str, Any]]:
+    """
+    Search a company's people for any of ``titles`` with a single OR query.
+
+    Results are filtered to people whose occupation mentions one of the titles.
+    An empty list means callers should fall back to one search per title.
+    """
+    combined = " OR ".join(f'"{title}"' for title in titles)
+    people = client.search_people(company_name=company_name, title=combined, limit=limit)
+
+    title_pattern = _keyword_pattern(tuple(titles))
+    return [person for person in people if title_pattern.search(person.get("occupation") or "")]
+
+def _common_names(items1: List[Dict[str, Any]], items2: List[Dict[str, Any]], key: str) -> List[str]:
+    """
+    Return the lowercased ``key`` values present in both lists.
+
+    Missing or empty names are ignored; order follows ``items1``.
+    """
+    names2 = {item.get(key, "").lower() for item in items2 if item.get(key)}
+    return [name for name in dict.fromkeys(item.get(key, "").lower() for item in items1 if item.get(key))
+            if name in names2]
+
+def _format_person(person: Dict[str, Any], company_name: Optional[str] = None, **extra: Any) -> Dict[str, Any]:
+    """
+    Shape a people search result for tool output.
+
+    :param company_name: Company to report; defaults to the person's most recent experience
+    :param extra: Additional fields placed before the profile URL
+    """
+    profile_id = person.get("public_id", "")
+    if company_name is None:
+        experience = person.get("experience")
+        company_name = experience[0].get("companyName", "") if experience else ""
+
+    return {
+        "id": profile_id,
+        "name": f"{person.get('firstName', '')} {person.get('lastName', '')}",
+        "title": person.get("occupation", ""),
+        "company": company_name,
+        "location": person.get("locationName", ""),
+        **extra,
+        "url": f"{_PROFILE_URL_PREFIX}{profile_id}",
+    }
+
+def _format_contact(person: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a decision maker attached to a company recommendation."""
+    return {
+        "name": f"{person.get('firstName', '')} {person.get('lastName', '')}",
+        "title": person.get("occupation", ""),
+        "url": f"{_PROFILE_URL_PREFIX}{person.get('public_id', '')}",
+    }
+
+def _format_company_details(details: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the industry, country and staff count from company details."""
+    headquarter = details.get("headquarter")
+    return {
+        "industry": details["industries"][0] if details.get("industries") else "Unknown",
+        "location": headquarter.get("country", "Unknown") if headquarter else "Unknown",
+        "size": details.get("staffCount", "Unknown"),
+    }
+
+# Voyager payload keys for job posting companies and feed updates
+_JOB_COMPANY_KEY = "com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany"
+_UPDATE_KEY = "com.linkedin.voyager.feed.render.UpdateV2"
+
+# Shared read-only stand-in for missing nested objects, so lookups don't allocate a dict per miss
+_EMPTY = MappingProxyType({})
+
+def _dig(data: Any, *keys: str, default: Any = None) -> Any:
+    """Follow ``keys`` through nested dicts, returning ``default`` if any level is missing."""
+    for key in keys:
+        if not isinstance(data, dict) or key not in data:
+            return default
+        data = data[key]
+    return data
+
+def _date_range(entry: Dict[str, Any], ongoing: str = "") -> str:
+    """Format the start and end years of an experience or education entry."""
+    time_period = entry.get("timePeriod") or _EMPTY
+    start_year = (time_period.get("startDate") or _EMPTY).get("year", "")
+    end_year = (time_period.get("endDate") or _EMPTY).get("year", ongoing)
+    return f"{start_year} - {end_year}"
+
+def _job_company(job_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the resolved company of a job posting, or an empty dict."""
+    return _dig(job_data, "companyDetails", _JOB_COMPANY_KEY, "companyResolutionResult", default=_EMPTY)
+
+def _update_body(update: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the rendered body of a feed update, or an empty dict."""
+    return _dig(update, "value", _UPDATE_KEY, default=_EMPTY)
+
+def _update_text(update: Dict[str, Any], default: str = "") -> str:
+    """Return the commentary text of a feed update."""
+    return (_update_body(update).get("commentary") or _EMPTY).get("text", default)
+
+# Tool results are compact JSON; MCP_LINKEDIN_PRETTY=1 indents them for debugging
+PRETTY_JSON = os.getenv("MCP_LINKEDIN_PRETTY") == "1"
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to JSON, using orjson when it is installed."""
+    if orjson is None:
+        if PRETTY_JSON:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if PRETTY_JSON else None).decode()
+
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: Tuple[str, ...]):
+    """
+    Compile a case-insensitive pattern matching any of ``keywords``.
+
+    Only suitable for yes/no checks with ``search()``: an alternation skips
+    keywords overlapping an earlier match, so use ``_scan_keywords`` to find
+    which keywords occur.
+    """
+    alternatives = sorted(set(keywords), key=len, reverse=True)
+    return re.compile("|".join(re.escape(k) for k in alternatives), re.IGNORECASE)
 
 @mcp.tool()
+@_offload
 def get_feed_posts(limit: int = 10, offset: int = 0) -> str:
     """
     Retrieve LinkedIn feed posts.
@@ -25,13 +461,12 @@ def get_feed_posts(limit: int = 10, offset: int = 0) -> str:
         logger.error(f"Error: {e}")
         return f"Error: {e}"
 
-    posts = ""
-    for urn in post_urns:
-        posts += f"Post by {urn['author_name']}: {urn['content']}\n"
+    posts = [f"Post by {urn['author_name']}: {urn['content']}\n" for urn in post_urns]
 
-    return posts
+    return "".join(posts)
 
 @mcp.tool()
+@_offload
 def search_jobs(keywords: str, limit: int = 3, offset: int = 0, location: str = '') -> str:
     """
     Search for jobs on LinkedIn.
@@ -48,21 +483,23 @@ def search_jobs(keywords: str, limit: int = 3, offset: int = 0, location: str =
         limit=limit,
         offset=offset,
     )
-    job_results = ""
-    for job in jobs:
-        job_id = job["entityUrn"].split(":")[-1]
-        job_data = client.get_job(job_id=job_id)
 
-        job_title = job_data["title"]
-        company_name = job_data["companyDetails"]["com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany"]["companyResolutionResult"]["name"]
-        job_description = job_data["description"]["text"]
-        job_location = job_data["formattedLocation"]
+    def fetch_job(job):
+        job_id = job["entityUrn"].split(":")[-1]
+        return cached_get_job(job_id)
 
-        job_results += f"Job by {job_title} at {company_name} in {job_location}: {job_description}\n\n"
+    # Job details are independent requests, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        job_datas = list(executor.map(fetch_job, jobs))
 
-    return job_results
+    return "".join(
+        f"Job by {job_data['title']} at {_job_company(job_data).get('name', 'Unknown')} "
+        f"in {job_data['formattedLocation']}: {job_data['description']['text']}\n\n"
+        for job_data in job_datas
+    )
 
 @mcp.tool()
+@_offload
 def search_companies(keywords: str, industry: str = None, location: str = None, limit: int = 10) -> str:
     """
     Search for companies on LinkedIn based on keywords, industry, and location.
@@ -73,7 +510,6 @@ def search_companies(keywords: str, industry: str = None, location: str = None,
     :param limit: Maximum number of company results
     :return: List of company details
     """
-    client = get_client()
     try:
         # Combine all search terms into keywords list
         keyword_list = [keywords]
@@ -86,7 +522,7 @@ def search_companies(keywords: str, industry: str = None, location: str = None,
             keyword_list.append(location)
 
         # Execute search with combined keywords
-        companies = client.search_companies(
+        companies = cached_search_companies(
             keywords=keyword_list,
             limit=limit
         )
@@ -101,58 +537,49 @@ def search_companies(keywords: str, industry: str = None, location: str = None,
 
             # Get detailed company info if possible
             try:
-                company_details = client.get_company(urn_id)
-                company_id = urn_id
-                company_name = name
-                company_industry = company_details.get("industries", ["Unknown"])[0] if company_details.get("industries") else "Unknown"
-                company_location = company_details.get("headquarter", {}).get("country", "Unknown") if company_details.get("headquarter") else "Unknown"
+                company_details = cached_get_company(urn_id)
                 company_description = company_details.get("description", "No description available")
-                company_size = company_details.get("staffCount", "Unknown")
             except Exception:
                 # Fallback to basic info if detailed info isn't available
-                company_id = urn_id
-                company_name = name
-                company_industry = "Unknown"
-                company_location = "Unknown"
+                company_details = {}
                 company_description = headline
-                company_size = "Unknown"
-
-            company_url = f"https://www.linkedin.com/company/{company_id}"
 
+            summary = _format_company_details(company_details)
             results.append({
-                "id": company_id,
-                "name": company_name,
-                "industry": company_industry,
-                "location": company_location,
+                "id": urn_id,
+                "name": name,
+                "industry": summary["industry"],
+                "location": summary["location"],
                 "description": company_description,
-                "size": company_size,
-                "url": company_url
+                "size": summary["size"],
+                "url": f"{_COMPANY_URL_PREFIX}{urn_id}"
             })
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error searching companies: {e}")
         return f"Error searching companies: {e}"
 
 @mcp.tool()
-def get_company_details(company_id: str) -> str:
+@_offload
+def get_company_details(company_id: str, refresh: bool = False) -> str:
     """
     Get detailed information about a specific company.
 
     :param company_id: LinkedIn company ID
+    :param refresh: Fetch fresh data instead of using cached results
     :return: Detailed company information
     """
-    client = get_client()
     try:
-        company = client.get_company(company_id)
+        company = cached_get_company(company_id, refresh=refresh)
 
         # Extract key information
         company_name = company.get("name", "Unknown")
         company_industry = company.get("industries", ["Unknown"])[0] if company.get("industries") else "Unknown"
         company_description = company.get("description", "No description available")
         company_website = company.get("websiteUrl", "Unknown")
-        company_headquarter = company.get("headquarter", {})
+        company_headquarter = company.get("headquarter") or _EMPTY
         company_location = f"{company_headquarter.get('city', '')}, {company_headquarter.get('country', '')}" if company_headquarter else "Unknown"
         company_size = company.get("staffCount", "Unknown")
         company_specialties = company.get("specialities", [])
@@ -170,13 +597,14 @@ def get_company_details(company_id: str) -> str:
             "founded": company_founded,
         }
 
-        return json.dumps(company_details, indent=2)
+        return _dumps(company_details)
 
     except Exception as e:
         logger.error(f"Error getting company details: {e}")
         return f"Error getting company details: {e}"
 
 @mcp.tool()
+@_offload
 def search_people(keywords: str = None, title: str = None, company: str = None,
                  industry: str = None, location: str = None,
                  school: str = None, skill: str = None, limit: int = 10) -> str:
@@ -220,58 +648,40 @@ def search_people(keywords: str = None, title: str = None, company: str = None,
 
         # Filter by skill if provided
         if skill and people:
-            filtered_people = []
-            for person in people:
-                profile_id = person.get("public_id", "")
-                profile_skills = client.get_profile_skills(profile_id)
-
-                if any(skill.lower() in s.get("name", "").lower() for s in profile_skills):
-                    filtered_people.append(person)
+            needle = skill.lower()
+            profile_ids = [person.get("public_id", "") for person in people]
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                skill_lists = list(executor.map(cached_get_profile_skills, profile_ids))
+
+            filtered_people = [
+                person for person, profile_skills in zip(people, skill_lists)
+                if any(needle in s.get("name", "").lower() for s in profile_skills)
+            ]
 
             people = filtered_people[:limit]
 
         # Format results
-        results = []
-        for person in people:
-            profile_id = person.get("public_id", "")
-            profile_urn = person.get("urn_id", "")
-            profile_name = f"{person.get('firstName', '')} {person.get('lastName', '')}"
-            profile_title = person.get("occupation", "")
-            profile_location = person.get("locationName", "")
-            profile_url = f"https://www.linkedin.com/in/{profile_id}"
+        results = [_format_person(person) for person in people]
 
-            # Get current company
-            current_company = ""
-            if person.get("experience") and len(person.get("experience")) > 0:
-                current_company = person.get("experience")[0].get("companyName", "")
-
-            results.append({
-                "id": profile_id,
-                "name": profile_name,
-                "title": profile_title,
-                "company": current_company,
-                "location": profile_location,
-                "url": profile_url
-            })
-
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error searching people: {e}")
         return f"Error searching people: {e}"
 
 @mcp.tool()
-def get_profile_details(profile_id: str) -> str:
+@_offload
+def get_profile_details(profile_id: str, refresh: bool = False) -> str:
     """
     Get detailed information about a specific LinkedIn profile.
 
     :param profile_id: LinkedIn profile ID/public_id
+    :param refresh: Fetch fresh data instead of using cached results
     :return: Detailed profile information
     """
-    client = get_client()
     try:
-        profile = client.get_profile(profile_id)
-        skills = client.get_profile_skills(profile_id)
+        profile = cached_get_profile(profile_id, refresh=refresh)
+        skills = cached_get_profile_skills(profile_id, refresh=refresh)
 
         # Extract key information
         full_name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}"
@@ -280,24 +690,26 @@ def get_profile_details(profile_id: str) -> str:
         industry = profile.get("industryName", "")
 
         # Experience
-        experience = []
-        for exp in profile.get("experience", []):
-            experience.append({
+        experience = [
+            {
                 "company": exp.get("companyName", ""),
                 "title": exp.get("title", ""),
                 "description": exp.get("description", ""),
-                "date_range": f"{exp.get('timePeriod', {}).get('startDate', {}).get('year', '')} - {exp.get('timePeriod', {}).get('endDate', {}).get('year', 'Present')}"
-            })
+                "date_range": _date_range(exp, "Present")
+            }
+            for exp in profile.get("experience", [])
+        ]
 
         # Education
-        education = []
-        for edu in profile.get("education", []):
-            education.append({
+        education = [
+            {
                 "school": edu.get("schoolName", ""),
                 "degree": edu.get("degreeName", ""),
                 "field": edu.get("fieldOfStudy", ""),
-                "date_range": f"{edu.get('timePeriod', {}).get('startDate', {}).get('year', '')} - {edu.get('timePeriod', {}).get('endDate', {}).get('year', '')}"
-            })
+                "date_range": _date_range(edu)
+            }
+            for edu in profile.get("education", [])
+        ]
 
         # Skills
         skill_list = [skill.get("name", "") for skill in skills]
@@ -312,16 +724,17 @@ def get_profile_details(profile_id: str) -> str:
             "experience": experience,
             "education": education,
             "skills": skill_list,
-            "url": f"https://www.linkedin.com/in/{profile_id}"
+            "url": f"{_PROFILE_URL_PREFIX}{profile_id}"
         }
 
-        return json.dumps(profile_details, indent=2)
+        return _dumps(profile_details)
 
     except Exception as e:
         logger.error(f"Error getting profile details: {e}")
         return f"Error getting profile details: {e}"
 
 @mcp.tool()
+@_offload
 def search_company_employees(company_id: str, title: str = None, limit: int = 10) -> str:
     """
     Search for employees at a specific company, optionally filtered by job title.
@@ -334,7 +747,7 @@ def search_company_employees(company_id: str, title: str = None, limit: int = 10
     client = get_client()
     try:
         # Get company name first
-        company = client.get_company(company_id)
+        company = cached_get_company(company_id)
         company_name = company.get("name", "")
 
         if not company_name:
@@ -356,30 +769,16 @@ def search_company_employees(company_id: str, title: str = None, limit: int = 10
         )
 
         # Format results
-        results = []
-        for person in employees:
-            profile_id = person.get("public_id", "")
-            profile_name = f"{person.get('firstName', '')} {person.get('lastName', '')}"
-            profile_title = person.get("occupation", "")
-            profile_location = person.get("locationName", "")
-            profile_url = f"https://www.linkedin.com/in/{profile_id}"
-
-            results.append({
-                "id": profile_id,
-                "name": profile_name,
-                "title": profile_title,
-                "company": company_name,
-                "location": profile_location,
-                "url": profile_url
-            })
+        results = [_format_person(person, company_name) for person in employees]
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error searching company employees: {e}")
         return f"Error searching company employees: {e}"
 
 @mcp.tool()
+@_offload
 def search_people_by_skills(skills: List[str], title: str = None, industry: str = None,
                            location: str = None, limit: int = 10) -> str:
     """
@@ -416,61 +815,43 @@ def search_people_by_skills(skills: List[str], title: str = None, industry: str
         )
 
         # Filter by all skills
+        skills_lower = [skill.lower() for skill in skills]
         filtered_people = []
         for person in people:
             profile_id = person.get("public_id", "")
-            profile_skills = client.get_profile_skills(profile_id)
-            profile_skill_names = [s.get("name", "").lower() for s in profile_skills]
+            profile_skills = cached_get_profile_skills(profile_id)
+            # Newline-separated so a required skill cannot match across two skill names
+            profile_skill_names = "\n".join(s.get("name", "").lower() for s in profile_skills)
 
             # Check if the person has all the required skills
-            has_all_skills = all(any(skill.lower() in skill_name for skill_name in profile_skill_names) for skill in skills)
+            has_all_skills = all(skill in profile_skill_names for skill in skills_lower)
 
             if has_all_skills:
-                filtered_people.append(person)
+                # Keep the fetched skills so they are not requested again below
+                filtered_people.append((person, profile_skills))
 
                 # Break if we have enough results
                 if len(filtered_people) >= limit:
                     break
 
         # Format results
-        results = []
-        for person in filtered_people[:limit]:
-            profile_id = person.get("public_id", "")
-            profile_name = f"{person.get('firstName', '')} {person.get('lastName', '')}"
-            profile_title = person.get("occupation", "")
-            profile_location = person.get("locationName", "")
-            profile_url = f"https://www.linkedin.com/in/{profile_id}"
-
-            # Get current company
-            current_company = ""
-            if person.get("experience") and len(person.get("experience")) > 0:
-                current_company = person.get("experience")[0].get("companyName", "")
-
-            # Get matched skills
-            person_skills = client.get_profile_skills(profile_id)
-            matched_skills = []
-            for person_skill in person_skills:
-                skill_name = person_skill.get("name", "")
-                if any(s.lower() in skill_name.lower() for s in skills):
-                    matched_skills.append(skill_name)
-
-            results.append({
-                "id": profile_id,
-                "name": profile_name,
-                "title": profile_title,
-                "company": current_company,
-                "location": profile_location,
-                "matched_skills": matched_skills,
-                "url": profile_url
-            })
+        results = [
+            _format_person(person, matched_skills=[
+                skill_name
+                for skill_name in (person_skill.get("name", "") for person_skill in person_skills)
+                if any(s in skill_name.lower() for s in skills_lower)
+            ])
+            for person, person_skills in filtered_people[:limit]
+        ]
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error searching people by skills: {e}")
         return f"Error searching people by skills: {e}"
 
 @mcp.tool()
+@_offload
 def get_company_updates(company_id: str, limit: int = 5) -> str:
     """
     Get recent updates and posts from a company.
@@ -487,26 +868,27 @@ def get_company_updates(company_id: str, limit: int = 5) -> str:
         # Format results
         results = []
         for update in updates:
-            update_text = update.get("value", {}).get("com.linkedin.voyager.feed.render.UpdateV2", {}).get("commentary", {}).get("text", "No content")
+            update_text = _update_text(update, "No content")
 
             # Get timestamp if available
             timestamp = None
-            actor = update.get("value", {}).get("com.linkedin.voyager.feed.render.UpdateV2", {}).get("actor", {})
+            actor = _update_body(update).get("actor")
             if actor:
-                timestamp = actor.get("subDescription", {}).get("text", "")
+                timestamp = _dig(actor, "subDescription", "text", default="")
 
             results.append({
                 "content": update_text,
                 "timestamp": timestamp
             })
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error getting company updates: {e}")
         return f"Error getting company updates: {e}"
 
 @mcp.tool()
+@_offload
 def find_decision_makers(company_id: str, titles: List[str] = None, limit: int = 5) -> str:
     """
     Find decision makers at a specific company based on their job titles.
@@ -523,60 +905,48 @@ def find_decision_makers(company_id: str, titles: List[str] = None, limit: int =
             titles = ["CEO", "CTO", "CIO", "Director", "VP", "Head", "Manager"]
 
         # Get company name first
-        company = client.get_company(company_id)
+        company = cached_get_company(company_id)
         company_name = company.get("name", "")
 
         if not company_name:
             return "Error: Could not find company name"
 
-        # Search for decision makers
-        decision_makers = []
-
-        for title in titles:
-            # Search for people with this title at the company
-            search_params = {
-                "company_name": company_name,
-                "title": title
-            }
-
-            # Execute search
-            people = client.search_people(
-                **search_params,
-                limit=limit // len(titles) + 1  # Distribute limit across titles
-            )
+        # Search for all titles at once, oversampling to allow for filtering
+        decision_makers = _search_people_by_titles(client, company_name, titles, limit * 2)
+
+        # Fall back to one search per title if the combined query found nothing
+        if not decision_makers:
+            for title in titles:
+                # Search for people with this title at the company
+                search_params = {
+                    "company_name": company_name,
+                    "title": title
+                }
+
+                # Execute search
+                people = client.search_people(
+                    **search_params,
+                    limit=limit // len(titles) + 1  # Distribute limit across titles
+                )
 
-            # Add to results
-            decision_makers.extend(people)
+                # Add to results
+                decision_makers.extend(people)
 
-            # Break if we have enough results
-            if len(decision_makers) >= limit:
-                break
+                # Break if we have enough results
+                if len(decision_makers) >= limit:
+                    break
 
         # Format results
-        results = []
-        for person in decision_makers[:limit]:
-            profile_id = person.get("public_id", "")
-            profile_name = f"{person.get('firstName', '')} {person.get('lastName', '')}"
-            profile_title = person.get("occupation", "")
-            profile_location = person.get("locationName", "")
-            profile_url = f"https://www.linkedin.com/in/{profile_id}"
-
-            results.append({
-                "id": profile_id,
-                "name": profile_name,
-                "title": profile_title,
-                "company": company_name,
-                "location": profile_location,
-                "url": profile_url
-            })
+        results = [_format_person(person, company_name) for person in decision_makers[:limit]]
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error finding decision makers: {e}")
         return f"Error finding decision makers: {e}"
 
 @mcp.tool()
+@_offload
 def generate_lead_recommendations(industry: str = None, company_size: str = None,
                                 technologies: List[str] = None, location: str = None,
                                 limit: int = 5) -> str:
@@ -604,7 +974,7 @@ def generate_lead_recommendations(industry: str = None, company_size: str = None
             keyword_list.append(location)
 
         # Execute search
-        companies = client.search_companies(
+        companies = cached_search_companies(
             keywords=keyword_list,
             limit=limit * 2  # Search for more to filter later
         )
@@ -612,139 +982,141 @@ def generate_lead_recommendations(industry: str = None, company_size: str = None
         # Filter companies by size if needed
         filtered_companies = companies
         if company_size:
-            size_ranges = {
-                "small": (1, 50),
-                "medium": (51, 500),
-                "large": (501, float('inf'))
-            }
+            range_min, range_max = COMPANY_SIZE_RANGES.get(company_size.lower(), (0, float('inf')))
 
-            range_min, range_max = size_ranges.get(company_size.lower(), (0, float('inf')))
-
-            filtered_companies = []
-            for company in companies:
+            def get_staff_count(company):
                 # Try to get detailed company info to check size
                 try:
-                    company_id = company.get("urn_id", "")
-                    company_details = client.get_company(company_id)
-                    staff_count = company_details.get("staffCount", 0)
-
-                    if range_min <= staff_count <= range_max:
-                        filtered_companies.append(company)
+                    return cached_get_company(company.get("urn_id", "")).get("staffCount", 0)
                 except Exception:
-                    # If we can't get staff count, skip size filtering for this company
-                    filtered_companies.append(company)
+                    return None
+
+            # The detail lookups dominate this filter, so run them concurrently
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                staff_counts = list(executor.map(get_staff_count, companies))
+
+            # If we can't get staff count, skip size filtering for this company
+            filtered_companies = [
+                company for company, staff_count in zip(companies, staff_counts)
+                if staff_count is None or range_min <= staff_count <= range_max
+            ]
+
+        lead_companies = filtered_companies[:limit]
+
+        # Default titles for IT services sales
+        titles = ["CTO", "CIO", "IT Director", "VP of Technology", "Head of IT"]
+
+        def find_decision_makers_for(task):
+            company_name, title = task
+            try:
+                return client.search_people(
+                    company_name=company_name,
+                    title=title,
+                    limit=2  # Just get a couple per title
+                )
+            except Exception as e:
+                logger.warning(f"Error finding decision makers for {company_name}: {e}")
+                return []
+
+        technology_automaton = _keyword_automaton(tuple(technologies or ()))
+
+        def check_technology_fit(company):
+            company_id = company.get("urn_id", "")
+            company_name = company.get("name", "Unknown")
+
+            # Search for company updates or job postings mentioning the technologies
+            try:
+                # Get company updates
+                updates = client.get_company_updates(company_id, limit=5)
+
+                # Check if any updates mention the technologies
+                found = set()
+                for update in updates:
+                    update_text = _update_text(update)
+                    found |= _scan_keywords(technology_automaton, update_text.lower())
+
+                mentions = [tech for tech in technologies if tech.lower() in found]
+
+                if mentions:
+                    return "High - Mentioned in company updates: " + ", ".join(mentions)
+
+                # Check job postings
+                jobs = client.search_jobs(
+                    keywords=" ".join(technologies),
+                    company_name=company_name,
+                    limit=5
+                )
+
+                if jobs:
+                    return "Medium - Company has job postings with relevant technologies"
+                return "Low - No direct mentions found"
+
+            except Exception as e:
+                logger.warning(f"Error checking technology fit for {company_name}: {e}")
+                return "Unknown"
+
+        # Companies sharing a name (e.g. parent and subsidiary) or an ID would repeat
+        # identical lookups, so each distinct search is issued once per call.
+        # Limit to two titles to avoid too many API calls.
+        people_tasks = list(dict.fromkeys(
+            (company.get("name", "Unknown"), title)
+            for company in lead_companies
+            for title in titles[:2]
+        ))
+        fit_companies = {}
+        if technologies:
+            for company in lead_companies:
+                fit_companies.setdefault(company.get("urn_id", ""), company)
+
+        # Run the people searches and technology fit checks in one pool
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # map() submits eagerly, so both batches run in the pool together
+            people_results = executor.map(find_decision_makers_for, people_tasks)
+            technology_fits = dict(zip(fit_companies, executor.map(check_technology_fit, fit_companies.values())))
+            people_found = dict(zip(people_tasks, people_results))
 
         # Generate recommendations
         recommendations = []
-        for company in filtered_companies[:limit]:
+        for company in lead_companies:
             company_id = company.get("urn_id", "")
             company_name = company.get("name", "Unknown")
 
             # Get detailed company info if possible
             try:
-                company_details = client.get_company(company_id)
-                company_industry = company_details.get("industries", ["Unknown"])[0] if company_details.get("industries") else "Unknown"
-                company_location = company_details.get("headquarter", {}).get("country", "Unknown") if company_details.get("headquarter") else "Unknown"
-                company_size = company_details.get("staffCount", "Unknown")
+                company_details = cached_get_company(company_id)
             except Exception:
                 # Fallback to basic info
-                company_industry = "Unknown"
-                company_location = "Unknown"
-                company_size = "Unknown"
+                company_details = {}
 
-            # Find decision makers
+            # Collect decision makers found for this company, title by title
             decision_makers = []
-            try:
-                # Default titles for IT services sales
-                titles = ["CTO", "CIO", "IT Director", "VP of Technology", "Head of IT"]
-
-                # Get decision makers
-                for title in titles[:2]:  # Limit to two titles to avoid too many API calls
-                    search_params = {
-                        "company_name": company_name,
-                        "title": title
-                    }
-
-                    # Execute search
-                    people = client.search_people(
-                        **search_params,
-                        limit=2  # Just get a couple per title
-                    )
-
-                    # Add to results
-                    for person in people:
-                        profile_id = person.get("public_id", "")
-                        profile_name = f"{person.get('firstName', '')} {person.get('lastName', '')}"
-                        profile_title = person.get("occupation", "")
-                        profile_url = f"https://www.linkedin.com/in/{profile_id}"
-
-                        decision_makers.append({
-                            "name": profile_name,
-                            "title": profile_title,
-                            "url": profile_url
-                        })
-
-                        # Break if we have enough decision makers
-                        if len(decision_makers) >= 2:
-                            break
+            for title in titles[:2]:
+                for person in people_found[(company_name, title)]:
+                    decision_makers.append(_format_contact(person))
 
-            except Exception as e:
-                logger.warning(f"Error finding decision makers for {company_name}: {e}")
-
-            # Generate technology fit if technologies are provided
-            technology_fit = "Unknown"
-            if technologies:
-                # Search for company updates or job postings mentioning the technologies
-                try:
-                    # Get company updates
-                    updates = client.get_company_updates(company_id, limit=5)
-
-                    # Check if any updates mention the technologies
-                    mentions = []
-                    for update in updates:
-                        update_text = update.get("value", {}).get("com.linkedin.voyager.feed.render.UpdateV2", {}).get("commentary", {}).get("text", "")
-
-                        for tech in technologies:
-                            if tech.lower() in update_text.lower():
-                                mentions.append(tech)
-
-                    if mentions:
-                        technology_fit = "High - Mentioned in company updates: " + ", ".join(mentions)
-                    else:
-                        # Check job postings
-                        jobs = client.search_jobs(
-                            keywords=" ".join(technologies),
-                            company_name=company_name,
-                            limit=5
-                        )
-
-                        if jobs:
-                            technology_fit = "Medium - Company has job postings with relevant technologies"
-                        else:
-                            technology_fit = "Low - No direct mentions found"
+                    # Break if we have enough decision makers
+                    if len(decision_makers) >= 2:
+                        break
 
-                except Exception as e:
-                    logger.warning(f"Error checking technology fit for {company_name}: {e}")
+            technology_fit = technology_fits.get(company_id, "Unknown")
 
             recommendations.append({
                 "company_id": company_id,
                 "company_name": company_name,
-                "industry": company_industry,
-                "location": company_location,
-                "size": company_size,
+                **_format_company_details(company_details),
                 "technology_fit": technology_fit,
                 "decision_makers": decision_makers,
-                "company_url": f"https://www.linkedin.com/company/{company_id}"
+                "company_url": f"{_COMPANY_URL_PREFIX}{company_id}"
             })
 
-        return json.dumps(recommendations, indent=2)
+        return _dumps(recommendations)
 
     except Exception as e:
         logger.error(f"Error generating lead recommendations: {e}")
         return f"Error generating lead recommendations: {e}"
 
 @mcp.tool()
-def identify_target_accounts(industry: str, keywords: List[str] = None, location: str = None,
+async def identify_target_accounts(industry: str, keywords: List[str] = None, location: str = None,
                            min_size: int = None, max_size: int = None,
                            technology_interests: List[str] = None,
                            limit: int = 10) -> str:
@@ -760,8 +1132,17 @@ def identify_target_accounts(industry: str, keywords: List[str] = None, location
     :param limit: Maximum number of accounts to return
     :return: List of potential target accounts with details
     """
-    client = get_client()
+    # LinkedIn calls are blocking, so each one runs in a worker thread while
+    # the fan-outs below are awaited together on the event loop
+    semaphore = asyncio.Semaphore(MAX_WORKERS)
+
+    async def run(func, *args, **kwargs):
+        async with semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
     try:
+        client = await run(get_client)
+
         # Build search keywords
         search_keywords = [industry]
 
@@ -770,21 +1151,36 @@ def identify_target_accounts(industry: str, keywords: List[str] = None, location
             search_keywords.append(location)
 
         # Execute search
-        companies = client.search_companies(
+        companies = await run(
+            cached_search_companies,
             keywords=search_keywords,
             limit=limit * 3  # Get more results for filtering
         )
 
-        # Apply filters
+        # Cheapest check first: a company without an ID cannot be looked up
+        candidates = [company for company in companies if company.get("urn_id")]
+
+        # Fetch details in windows sized to the companies still needed, applying
+        # the filters in search order, and stop once enough companies pass
+        keyword_pattern = _keyword_pattern(tuple(keywords)) if keywords else None
         filtered_companies = []
-        for company in companies:
-            # Get detailed company info if possible
-            try:
-                company_id = company.get("urn_id", "")
-                company_details = client.get_company(company_id)
+        position = 0
+        while position < len(candidates) and len(filtered_companies) < limit:
+            window = candidates[position:position + limit - len(filtered_companies)]
+            position += len(window)
+
+            details_results = await asyncio.gather(
+                *(run(cached_get_company, company["urn_id"]) for company in window),
+                return_exceptions=True
+            )
 
-                # Check company size
-                staff_count = company_details.get("staffCount", 0)
+            for company, company_details in zip(window, details_results):
+                # Skip if we can't get detailed info
+                if isinstance(company_details, Exception):
+                    continue
+
+                # Check company size before scanning the description
+                staff_count = company_details.get("staffCount") or 0
 
                 if min_size is not None and staff_count < min_size:
                     continue
@@ -793,40 +1189,58 @@ def identify_target_accounts(industry: str, keywords: List[str] = None, location
                     continue
 
                 # Check for keywords in description
-                description = company_details.get("description", "").lower()
+                if keyword_pattern and not keyword_pattern.search(company_details.get("description") or ""):
+                    continue
 
-                if keywords:
-                    keyword_match = False
-                    for keyword in keywords:
-                        if keyword.lower() in description:
-                            keyword_match = True
-                            break
+                # Add to filtered results with enriched data
+                filtered_companies.append((company, company_details))
 
-                    if not keyword_match:
-                        continue
+        target_companies = filtered_companies[:limit]
 
-                # Add to filtered results with enriched data
-                company["detailed_info"] = company_details
-                filtered_companies.append(company)
-            except Exception:
-                # Skip if we can't get detailed info
-                continue
+        # Default titles for IT services sales, limited to two titles to avoid too many API calls
+        titles = ["CTO", "CIO", "IT Director", "VP of Technology"][:2]
+        # Whole-word matches, so that e.g. "Director" doesn't count as "CTO"
+        title_patterns = [re.compile(rf"\b{re.escape(title)}\b", re.IGNORECASE) for title in titles]
+
+        async def find_decision_makers_for(company_name):
+            try:
+                # One search covering every title, just enough results for one per title
+                people = await run(_search_people_by_titles, client, company_name, titles, len(titles))
+
+                # Otherwise search title by title
+                if not people:
+                    people_by_title = await asyncio.gather(*(
+                        run(client.search_people, company_name=company_name, title=title, limit=1)
+                        for title in titles
+                    ))
+                    return [person for people in people_by_title for person in people]
+            except Exception as e:
+                logger.warning(f"Error finding decision makers for {company_name}: {e}")
+                return []
 
-            # Break if we have enough
-            if len(filtered_companies) >= limit:
-                break
+            # Keep at most one person per title, in title order
+            decision_makers = []
+            for title_pattern in title_patterns:
+                for person in people:
+                    if person not in decision_makers and title_pattern.search(person.get("occupation") or ""):
+                        decision_makers.append(person)
+                        break
+            return decision_makers
+
+        # Search each distinct company concurrently
+        company_names = list(dict.fromkeys(company.get("name", "Unknown") for company, _ in target_companies))
+        people_found = dict(zip(
+            company_names,
+            await asyncio.gather(*(find_decision_makers_for(company_name) for company_name in company_names))
+        ))
 
         # Format results
+        technology_automaton = _keyword_automaton(tuple(technology_interests or ()))
         results = []
-        for company in filtered_companies[:limit]:
+        for company, company_details in target_companies:
             company_id = company.get("urn_id", "")
             company_name = company.get("name", "Unknown")
 
-            # Try to get detailed info from our enriched data
-            company_details = company.get("detailed_info", {})
-            company_industry = company_details.get("industries", ["Unknown"])[0] if company_details.get("industries") else "Unknown"
-            company_location = company_details.get("headquarter", {}).get("country", "Unknown") if company_details.get("headquarter") else "Unknown"
-            company_size = company_details.get("staffCount", "Unknown")
             company_description = company_details.get("description", "No description available")[:200] + "..." if company_details.get("description") and len(company_details.get("description")) > 200 else company_details.get("description", "No description available")
 
             # Technology interest score
@@ -834,66 +1248,32 @@ def identify_target_accounts(industry: str, keywords: List[str] = None, location
             tech_mentions = []
 
             if technology_interests and company_description:
-                for tech in technology_interests:
-                    if tech.lower() in company_description.lower():
-                        tech_score += 1
-                        tech_mentions.append(tech)
+                found = _scan_keywords(technology_automaton, company_description.lower())
+                tech_mentions = [tech for tech in technology_interests if tech.lower() in found]
+                tech_score = len(tech_mentions)
 
-            # Find key decision makers
-            decision_makers = []
-            try:
-                # Default titles for IT services sales
-                titles = ["CTO", "CIO", "IT Director", "VP of Technology"]
-
-                # Get decision makers
-                for title in titles[:2]:  # Limit to two titles
-                    search_params = {
-                        "company_name": company_name,
-                        "title": title
-                    }
-
-                    # Execute search
-                    people = client.search_people(
-                        **search_params,
-                        limit=1  # Just get one per title
-                    )
-
-                    # Add to results
-                    for person in people:
-                        profile_id = person.get("public_id", "")
-                        profile_name = f"{person.get('firstName', '')} {person.get('lastName', '')}"
-                        profile_title = person.get("occupation", "")
-                        profile_url = f"https://www.linkedin.com/in/{profile_id}"
-
-                        decision_makers.append({
-                            "name": profile_name,
-                            "title": profile_title,
-                            "url": profile_url
-                        })
-
-            except Exception as e:
-                logger.warning(f"Error finding decision makers for {company_name}: {e}")
+            # Key decision makers found for this company
+            decision_makers = [_format_contact(person) for person in people_found[company_name]]
 
             results.append({
                 "company_id": company_id,
                 "company_name": company_name,
-                "industry": company_industry,
-                "location": company_location,
-                "size": company_size,
+                **_format_company_details(company_details),
                 "description": company_description,
                 "tech_score": tech_score,
                 "tech_mentions": tech_mentions,
                 "decision_makers": decision_makers,
-                "company_url": f"https://www.linkedin.com/company/{company_id}"
+                "company_url": f"{_COMPANY_URL_PREFIX}{company_id}"
             })
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error identifying target accounts: {e}")
         return f"Error identifying target accounts: {e}"
 
 @mcp.tool()
+@_offload
 def analyze_prospect_profile(profile_id: str, service_keywords: List[str] = None) -> str:
     """
     Analyze a prospect's profile for IT service sales.
@@ -902,11 +1282,10 @@ def analyze_prospect_profile(profile_id: str, service_keywords: List[str] = None
     :param service_keywords: List of IT service keywords to match against the profile
     :return: Analysis of the prospect's profile for IT service sales opportunities
     """
-    client = get_client()
     try:
         # Get profile details
-        profile = client.get_profile(profile_id)
-        skills = client.get_profile_skills(profile_id)
+        profile = cached_get_profile(profile_id)
+        skills = cached_get_profile_skills(profile_id)
 
         # Extract key information
         full_name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}"
@@ -914,72 +1293,52 @@ def analyze_prospect_profile(profile_id: str, service_keywords: List[str] = None
         location = profile.get("locationName", "")
         industry = profile.get("industryName", "")
 
-        # Default service keywords if not provided
-        if not service_keywords:
-            service_keywords = [
-                "cloud", "migration", "digital transformation", "infrastructure", "security",
-                "automation", "devops", "ai", "machine learning", "data analytics", "integration",
-                "erp", "crm", "software development", "consulting", "it services"
-            ]
+        # Service interest analysis: each text is scanned once for all keywords,
+        # using the prebuilt automaton for the default keywords
+        if service_keywords:
+            automaton = _keyword_automaton(tuple(service_keywords))
+            service_keywords_lc = [(keyword, keyword.lower()) for keyword in service_keywords]
+        else:
+            automaton = _DEFAULT_SERVICE_AUTOMATON
+            service_keywords_lc = _DEFAULT_SERVICE_KEYWORDS_LC
+        service_mentions = []
+        mentioned = set()
+        service_score = 0
 
-        # Experience
-        experience = []
+        # Check headline
+        headline_hits = _scan_keywords(automaton, headline.lower() if headline else "")
+        for keyword, keyword_lc in service_keywords_lc:
+            if keyword_lc in headline_hits:
+                service_mentions.append(keyword)
+                mentioned.add(keyword)
+                service_score += 2  # Higher weight for headline
+
+        # Walk experience once: capture the current job and collect descriptions
         current_company = ""
         current_title = ""
+        descriptions = []
 
         for exp in profile.get("experience", []):
-            company_name = exp.get("companyName", "")
-            title = exp.get("title", "")
-            description = exp.get("description", "")
-
-            # Capture current job
-            if exp.get("timePeriod", {}).get("endDate") is None:
-                current_company = company_name
-                current_title = title
-
-            experience.append({
-                "company": company_name,
-                "title": title,
-                "description": description
-            })
+            if _dig(exp, "timePeriod", "endDate") is None:
+                current_company = exp.get("companyName", "")
+                current_title = exp.get("title", "")
+            descriptions.append(exp.get("description") or "")
 
-        # Skills
+        # Check experience descriptions, then skills, in one scan.
+        # Mentions are ordered by the first text they appear in, as if each text were checked in turn.
         skill_list = [skill.get("name", "") for skill in skills]
-
-        # Decision maker analysis
-        decision_maker_score = 0
-        decision_maker_titles = ["cto", "cio", "vp", "director", "chief", "head", "lead", "senior", "manager"]
-
-        for title in decision_maker_titles:
-            if title in current_title.lower():
-                decision_maker_score += 1
-
-        is_decision_maker = decision_maker_score > 0
-
-        # Service interest analysis
-        service_mentions = []
-        service_score = 0
-
-        # Check headline
-        for keyword in service_keywords:
-            if headline and keyword.lower() in headline.lower():
+        first_text = _first_mentions(automaton, descriptions + skill_list)
+        for keyword, keyword_lc in sorted(
+            (pair for pair in service_keywords_lc if pair[1] in first_text),
+            key=lambda pair: first_text[pair[1]]
+        ):
+            if keyword not in mentioned:
                 service_mentions.append(keyword)
-                service_score += 2  # Higher weight for headline
+                mentioned.add(keyword)
+                service_score += 1
 
-        # Check experience descriptions
-        for exp in experience:
-            description = exp.get("description", "").lower()
-            for keyword in service_keywords:
-                if keyword.lower() in description and keyword not in service_mentions:
-                    service_mentions.append(keyword)
-                    service_score += 1
-
-        # Check skills
-        for skill in skill_list:
-            for keyword in service_keywords:
-                if keyword.lower() in skill.lower() and keyword not in service_mentions:
-                    service_mentions.append(keyword)
-                    service_score += 1
+        # Decision maker analysis: a single scan of the title for any fragment
+        is_decision_maker = _DM_TITLE_RE.search(current_title or "") is not None
 
         # Calculate opportunity score
         opportunity_score = 0
@@ -1015,17 +1374,18 @@ def analyze_prospect_profile(profile_id: str, service_keywords: List[str] = None
             "service_score": service_score,
             "opportunity_score": opportunity_score,
             "opportunity_level": opportunity_level,
-            "profile_url": f"https://www.linkedin.com/in/{profile_id}",
+            "profile_url": f"{_PROFILE_URL_PREFIX}{profile_id}",
             "skills": skill_list[:10]  # Include top 10 skills
         }
 
-        return json.dumps(analysis, indent=2)
+        return _dumps(analysis)
 
     except Exception as e:
         logger.error(f"Error analyzing prospect profile: {e}")
         return f"Error analyzing prospect profile: {e}"
 
 @mcp.tool()
+@_offload
 def find_companies_using_technologies(technologies: List[str], industry: str = None,
                                     location: str = None, limit: int = 10) -> str:
     """
@@ -1054,43 +1414,35 @@ def find_companies_using_technologies(technologies: List[str], industry: str = N
             search_keywords.append(location)
 
         # Execute search
-        companies = client.search_companies(
+        companies = cached_search_companies(
             keywords=search_keywords,
             limit=limit * 3  # Get more results for filtering
         )
 
-        # Format and filter results
+        # Format and filter results: each description is scanned once for all technologies
+        technology_automaton = _keyword_automaton(tuple(technologies))
+        technologies_lc = [(tech, tech.lower()) for tech in technologies]
         results = []
         for company in companies[:limit * 3]:
             # Get detailed company info if possible
             try:
                 company_id = company.get("urn_id", "")
-                company_details = client.get_company(company_id)
-                company_description = company_details.get("description", "").lower()
-
-                # Check for technology mentions in company description
-                tech_mentions = []
-                for tech in technologies:
-                    if tech.lower() in company_description:
-                        tech_mentions.append(tech)
+                company_details = cached_get_company(company_id)
+                company_description = (company_details.get("description") or "").lower()
 
                 # Only include companies that mention at least one technology
-                if not tech_mentions:
+                found = _scan_keywords(technology_automaton, company_description)
+                if not found:
                     continue
 
-                company_name = company.get("name", "Unknown")
-                company_industry = company_details.get("industries", ["Unknown"])[0] if company_details.get("industries") else "Unknown"
-                company_location = company_details.get("headquarter", {}).get("country", "Unknown") if company_details.get("headquarter") else "Unknown"
-                company_size = company_details.get("staffCount", "Unknown")
+                tech_mentions = [tech for tech, tech_lc in technologies_lc if tech_lc in found]
 
                 results.append({
                     "id": company_id,
-                    "name": company_name,
-                    "industry": company_industry,
-                    "location": company_location,
-                    "size": company_size,
+                    "name": company.get("name", "Unknown"),
+                    **_format_company_details(company_details),
                     "technologies_mentioned": tech_mentions,
-                    "url": f"https://www.linkedin.com/company/{company_id}"
+                    "url": f"{_COMPANY_URL_PREFIX}{company_id}"
                 })
 
                 # Break if we have enough results
@@ -1104,6 +1456,13 @@ def find_companies_using_technologies(technologies: List[str], industry: str = N
         if len(results) < limit:
             remaining = limit - len(results)
 
+            def fetch_job(job_id):
+                try:
+                    return cached_get_job(job_id)
+                except Exception as e:
+                    logger.warning(f"Error processing job {job_id}: {e}")
+                    return None
+
             # Get companies that have job postings with the technologies
             for tech in technologies:
                 # Skip if we already have enough results
@@ -1116,18 +1475,20 @@ def find_companies_using_technologies(technologies: List[str], industry: str = N
                     limit=remaining * 2
                 )
 
-                # Extract companies
-                for job in jobs:
+                # Fetch job details concurrently, then extract companies in search order
+                job_ids = [job.get("entityUrn", "").split(":")[-1] for job in jobs]
+                with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                    job_datas = list(executor.map(fetch_job, job_ids))
+
+                for job_id, job_data in zip(job_ids, job_datas):
                     if len(results) >= limit:
                         break
 
-                    job_id = job.get("entityUrn", "").split(":")[-1]
+                    if job_data is None:
+                        continue
 
                     try:
-                        job_data = client.get_job(job_id=job_id)
-
-                        company_data = job_data.get("companyDetails", {}).get("com.linkedin.voyager.deco.jobs.web.shared.WebCompactJobPostingCompany", {})
-                        company_info = company_data.get("companyResolutionResult", {})
+                        company_info = _job_company(job_data)
 
                         company_id = company_info.get("entityUrn", "").split(":")[-1] if company_info.get("entityUrn") else None
                         company_name = company_info.get("name", "Unknown")
@@ -1143,20 +1504,21 @@ def find_companies_using_technologies(technologies: List[str], industry: str = N
                             "location": "Unknown",  # Would need another API call
                             "size": "Unknown",      # Would need another API call
                             "technologies_mentioned": [tech],
-                            "url": f"https://www.linkedin.com/company/{company_id}" if company_id else "#",
+                            "url": f"{_COMPANY_URL_PREFIX}{company_id}" if company_id else "#",
                             "source": "Job Posting"
                         })
 
                     except Exception as e:
                         logger.warning(f"Error processing job {job_id}: {e}")
 
-        return json.dumps(results, indent=2)
+        return _dumps(results)
 
     except Exception as e:
         logger.error(f"Error finding companies using technologies: {e}")
         return f"Error finding companies using technologies: {e}"
 
 @mcp.tool()
+@_offload
 def find_common_connections(profile_id1: str, profile_id2: str, limit: int = 5) -> str:
     """
     Find common connections or similarities between two LinkedIn profiles.
@@ -1166,54 +1528,38 @@ def find_common_connections(profile_id1: str, profile_id2: str, limit: int = 5)
     :param limit: Maximum number of common connections to return
     :return: Analysis of common connections and similarities
     """
-    client = get_client()
     try:
-        # Get profile details
-        profile1 = client.get_profile(profile_id1)
-        profile2 = client.get_profile(profile_id2)
+        # Get both profiles and both skill lists concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            profile1_future = executor.submit(cached_get_profile, profile_id1)
+            profile2_future = executor.submit(cached_get_profile, profile_id2)
+            skills1_future = executor.submit(cached_get_profile_skills, profile_id1)
+            skills2_future = executor.submit(cached_get_profile_skills, profile_id2)
+            profile1, profile2 = profile1_future.result(), profile2_future.result()
+            skills1, skills2 = skills1_future.result(), skills2_future.result()
 
         # Extract names
         name1 = f"{profile1.get('firstName', '')} {profile1.get('lastName', '')}"
         name2 = f"{profile2.get('firstName', '')} {profile2.get('lastName', '')}"
 
-        # Find common companies
-        companies1 = [exp.get("companyName", "").lower() for exp in profile1.get("experience", [])]
-        companies2 = [exp.get("companyName", "").lower() for exp in profile2.get("experience", [])]
-
-        common_companies = []
-        for company in companies1:
-            if company in companies2 and company not in common_companies:
-                common_companies.append(company)
-
-        # Find common education
-        schools1 = [edu.get("schoolName", "").lower() for edu in profile1.get("education", [])]
-        schools2 = [edu.get("schoolName", "").lower() for edu in profile2.get("education", [])]
-
-        common_schools = []
-        for school in schools1:
-            if school in schools2 and school not in common_schools:
-                common_schools.append(school)
+        # Find common companies and education
+        common_companies = _common_names(profile1.get("experience", []), profile2.get("experience", []), "companyName")
+        common_schools = _common_names(profile1.get("education", []), profile2.get("education", []), "schoolName")
 
         # Find common skills
-        skills1 = [s.get("name", "").lower() for s in client.get_profile_skills(profile_id1)]
-        skills2 = [s.get("name", "").lower() for s in client.get_profile_skills(profile_id2)]
-
-        common_skills = []
-        for skill in skills1:
-            if skill in skills2 and skill not in common_skills:
-                common_skills.append(skill)
+        common_skills = _common_names(skills1, skills2, "name")
 
         # Format results
         common_connections = {
             "profile1": {
                 "id": profile_id1,
                 "name": name1,
-                "url": f"https://www.linkedin.com/in/{profile_id1}"
+                "url": f"{_PROFILE_URL_PREFIX}{profile_id1}"
             },
             "profile2": {
                 "id": profile_id2,
                 "name": name2,
-                "url": f"https://www.linkedin.com/in/{profile_id2}"
+                "url": f"{_PROFILE_URL_PREFIX}{profile_id2}"
             },
             "common_companies": common_companies,
             "common_schools": common_schools,
@@ -1221,13 +1567,14 @@ def find_common_connections(profile_id1: str, profile_id2: str, limit: int = 5)
             "connection_strength": len(common_companies) + len(common_schools) + min(len(common_skills), 5)
         }
 
-        return json.dumps(common_connections, indent=2)
+        return _dumps(common_connections)
 
     except Exception as e:
         logger.error(f"Error finding common connections: {e}")
         return f"Error finding common connections: {e}"
 
 @mcp.tool()
+@_offload
 def find_recent_job_changes(industry: str = None, title_keywords: List[str] = None,
                            location: str = None, limit: int = 10) -> str:
     """
@@ -1261,82 +1608,86 @@ def find_recent_job_changes(industry: str = None, title_keywords: List[str] = No
         )
 
         # Filter for recent job changes (looking at experience)
+        title_keywords_lc = [keyword.lower() for keyword in title_keywords or []]
         recent_changes = []
-        for person in people:
-            profile_id = person.get("public_id", "")
-
-            # Get full profile to analyze experience details
-            try:
-                profile = client.get_profile(profile_id)
-                experiences = profile.get("experience", [])
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Get full profiles concurrently, but evaluate them in search order
+            profile_ids = [person.get("public_id", "") for person in people]
+            futures = [executor.submit(cached_get_profile, profile_id) for profile_id in profile_ids]
 
-                # Need at least 2 experiences to detect a change
-                if len(experiences) < 2:
-                    continue
-
-                # Get the two most recent experiences
-                current_exp = experiences[0]
-                previous_exp = experiences[1]
+            for profile_id, future in zip(profile_ids, futures):
+                # Get full profile to analyze experience details
+                try:
+                    profile = future.result()
+                    experiences = profile.get("experience", [])
 
-                # Extract details
-                current_company = current_exp.get("companyName", "")
-                current_title = current_exp.get("title", "")
-                previous_company = previous_exp.get("companyName", "")
+                    # Need at least 2 experiences to detect a change
+                    if len(experiences) < 2:
+                        continue
 
-                # Skip if the companies are the same (internal move)
-                if current_company.lower() == previous_company.lower():
-                    continue
+                    # Get the two most recent experiences
+                    current_exp = experiences[0]
+                    previous_exp = experiences[1]
 
-                # Check if title matches any keywords (if provided)
-                if title_keywords:
-                    title_match = False
-                    for keyword in title_keywords:
-                        if keyword.lower() in current_title.lower():
-                            title_match = True
-                            break
+                    # Extract details
+                    current_company = current_exp.get("companyName", "")
+                    current_title = current_exp.get("title", "")
+                    previous_company = previous_exp.get("companyName", "")
 
-                    if not title_match:
+                    # Skip if the companies are the same (internal move)
+                    if current_company.lower() == previous_company.lower():
                         continue
 
-                # Check how recent the change is
-                current_start = current_exp.get("timePeriod", {}).get("startDate", {})
-                if current_start:
-                    start_year = current_start.get("year", 0)
-                    start_month = current_start.get("month", 0)
-
-                    # Get the current year and month
-                    # This is simplified - in production you'd use actual date comparison
-                    # Assuming changes in the last 6 months are "recent"
-                    if start_year >= 2024:  # Simplified check for recent changes
-                        # Format the result
-                        name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}"
-                        location = profile.get("locationName", "")
-
-                        recent_changes.append({
-                            "id": profile_id,
-                            "name": name,
-                            "current_title": current_title,
-                            "current_company": current_company,
-                            "previous_company": previous_company,
-                            "location": location,
-                            "url": f"https://www.linkedin.com/in/{profile_id}"
-                        })
+                    # Check if title matches any keywords (if provided)
+                    if title_keywords_lc:
+                        current_title_lc = current_title.lower()
+                        if not any(keyword in current_title_lc for keyword in title_keywords_lc):
+                            continue
 
-                        # Break if we have enough results
-                        if len(recent_changes) >= limit:
-                            break
+                    # Check how recent the change is
+                    current_start = _dig(current_exp, "timePeriod", "startDate", default=_EMPTY)
+                    if current_start:
+                        start_year = current_start.get("year", 0)
+                        start_month = current_start.get("month", 0)
+
+                        # Get the current year and month
+                        # This is simplified - in production you'd use actual date comparison
+                        # Assuming changes in the last 6 months are "recent"
+                        if start_year >= 2024:  # Simplified check for recent changes
+                            # Format the result
+                            name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}"
+                            location = profile.get("locationName", "")
+
+                            recent_changes.append({
+                                "id": profile_id,
+                                "name": name,
+                                "current_title": current_title,
+                                "current_company": current_company,
+                                "previous_company": previous_company,
+                                "location": location,
+                                "url": f"{_PROFILE_URL_PREFIX}{profile_id}"
+                            })
+
+                            # Break if we have enough results
+                            if len(recent_changes) >= limit:
+                                break
 
-            except Exception as e:
-                logger.warning(f"Error processing profile {profile_id}: {e}")
-                continue
+                except Exception as e:
+                    logger.warning(f"Error processing profile {profile_id}: {e}")
+                    continue
+
+            # Don't wait for profiles that are no longer needed
+            for future in futures:
+                future.cancel()
 
-        return json.dumps(recent_changes, indent=2)
+        return _dumps(recent_changes)
 
     except Exception as e:
         logger.error(f"Error finding recent job changes: {e}")
         return f"Error finding recent job changes: {e}"
 
 @mcp.tool()
+@_offload
 def generate_sales_outreach_context(profile_id: str, company_service: str) -> str:
     """
     Generate personalized context for sales outreach based on a LinkedIn profile.
@@ -1348,8 +1699,8 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
     client = get_client()
     try:
         # Get profile details
-        profile = client.get_profile(profile_id)
-        skills = client.get_profile_skills(profile_id)
+        profile = cached_get_profile(profile_id)
+        skills = cached_get_profile_skills(profile_id)
 
         # Extract key information
         full_name = f"{profile.get('firstName', '')} {profile.get('lastName', '')}"
@@ -1358,29 +1709,29 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
         current_company = ""
 
         # Experience
-        experience = []
-        for exp in profile.get("experience", []):
-            company_name = exp.get("companyName", "")
-            title = exp.get("title", "")
-
-            # Capture current job
-            if exp.get("timePeriod", {}).get("endDate") is None:
-                current_company = company_name
-                current_title = title
+        experience = [
+            {"company": exp.get("companyName", ""), "title": exp.get("title", "")}
+            for exp in profile.get("experience", [])
+        ]
 
-            experience.append({
-                "company": company_name,
-                "title": title
-            })
+        # Capture current job (the last entry without an end date)
+        current_exp = next(
+            (exp for exp in reversed(profile.get("experience", [])) if _dig(exp, "timePeriod", "endDate") is None),
+            None
+        )
+        if current_exp is not None:
+            current_company = current_exp.get("companyName", "")
+            current_title = current_exp.get("title", "")
 
         # Education
-        education = []
-        for edu in profile.get("education", []):
-            education.append({
+        education = [
+            {
                 "school": edu.get("schoolName", ""),
                 "degree": edu.get("degreeName", ""),
                 "field": edu.get("fieldOfStudy", "")
-            })
+            }
+            for edu in profile.get("education", [])
+        ]
 
         # Skills
         skill_list = [skill.get("name", "") for skill in skills]
@@ -1392,11 +1743,10 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
             # based on what the LinkedIn API provides for activity
             profile_posts = client.get_profile_posts(profile_id, limit=3)
 
-            for post in profile_posts:
-                activity.append({
-                    "type": "post",
-                    "content": post.get("commentary", {}).get("text", "")[:100] + "..."
-                })
+            activity = [
+                {"type": "post", "content": _dig(post, "commentary", "text", default="")[:100] + "..."}
+                for post in profile_posts
+            ]
 
         except Exception as e:
             logger.warning(f"Error getting profile activity: {e}")
@@ -1409,14 +1759,14 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
         try:
             if current_company:
                 # Search for the company
-                companies = client.search_companies(keywords=[current_company], limit=1)
+                companies = cached_search_companies(keywords=[current_company], limit=1)
 
                 if companies:
                     company = companies[0]
                     company_id = company.get("urn_id", "")
 
                     # Get more details
-                    company_info = client.get_company(company_id)
+                    company_info = cached_get_company(company_id)
                     company_size = company_info.get("staffCount", "Unknown")
                     company_industry = company_info.get("industries", ["Unknown"])[0] if company_info.get("industries") else "Unknown"
 
@@ -1437,7 +1787,7 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
                 "title": current_title,
                 "company": current_company,
                 "headline": headline,
-                "url": f"https://www.linkedin.com/in/{profile_id}"
+                "url": f"{_PROFILE_URL_PREFIX}{profile_id}"
             },
             "company_details": company_details,
             "top_skills": skill_list[:5],
@@ -1459,13 +1809,10 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
             })
 
         # Skills related to service
-        service_related_skills = []
         service_keywords = company_service.lower().split()
-
-        for skill in skill_list:
-            for keyword in service_keywords:
-                if keyword.lower() in skill.lower() and skill not in service_related_skills:
-                    service_related_skills.append(skill)
+        service_related_skills = list(dict.fromkeys(
+            skill for skill in skill_list if any(keyword in skill.lower() for keyword in service_keywords)
+        ))
 
         if service_related_skills:
             personalization_points.append({
@@ -1487,9 +1834,7 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
 
         # Career progression
         if len(experience) >= 2:
-            progression = []
-            for i, exp in enumerate(experience[:3]):
-                progression.append(f"{exp.get('title')} at {exp.get('company')}")
+            progression = [f"{exp.get('title')} at {exp.get('company')}" for exp in experience[:3]]
 
             personalization_points.append({
                 "type": "career",
@@ -1513,7 +1858,7 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
 
         outreach_context["conversation_starters"] = conversation_starters
 
-        return json.dumps(outreach_context, indent=2)
+        return _dumps(outreach_context)
 
     except Exception as e:
         logger.error(f"Error generating sales outreach context: {e}")
@@ -1521,4 +1866,4 @@ def generate_sales_outreach_context(profile_id: str, company_service: str) -> st
 
 # Add main execution block
 if __name__ == "__main__":
-    print(search_jobs(keywords="data engineer", location="Jakarta", limit=2))
+    print(asyncio.run(search_jobs(keywords="data engineer", location="Jakarta", limit=2)))